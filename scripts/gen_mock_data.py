@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Generate src/amc_mcp/_mock_data.py from the JSON files in data/
+Run this after editing any of the mock data files so the server picks up the change
+"""
+import json
+import pprint
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+DATA_DIR = ROOT / "data"
+OUTPUT = ROOT / "src" / "amc_mcp" / "_mock_data.py"
+
+# Module constant -> source file
+TABLES = {
+    "MOVIES": "movies.json",
+    "THEATERS": "theaters.json",
+    "SHOWTIMES": "showtimes.json",
+    "SEATS": "seats.json",
+}
+
+HEADER = '''"""
+Mock data as Python literals, generated from data/*.json by scripts/gen_mock_data.py
+Do not edit by hand: edit the JSON files and re-run the script
+"""
+'''
+
+
+def main():
+    """Write the generated module"""
+    parts = [HEADER]
+    for name, filename in TABLES.items():
+        with open(DATA_DIR / filename, "r") as f:
+            data = json.load(f)
+        parts.append(f"{name} = {pprint.pformat(data, width=100, sort_dicts=False)}\n")
+
+    OUTPUT.write_text("\n".join(parts))
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
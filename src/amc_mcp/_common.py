@@ -0,0 +1,134 @@
+"""
+Helpers shared by the FastMCP and low-level MCP server implementations
+"""
+import itertools
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Set, Tuple
+
+_WORD_RE = re.compile(r"\w+")
+
+# (response JSON up to the seat list, [(seat_number, JSON before is_available, JSON after)])
+SeatMapTemplate = Tuple[bytes, List[Tuple[str, bytes, bytes]]]
+
+# Last formatted timestamp, reused for every booking within the same second
+_last_ts_second = 0
+_last_ts_str = ""
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once per second"""
+    global _last_ts_second, _last_ts_str
+
+    now = int(time.time())
+    if now != _last_ts_second:
+        _last_ts_second = now
+        _last_ts_str = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return _last_ts_str
+
+
+class IdGenerator:
+    """Booking and payment ID generator"""
+
+    def __init__(self):
+        # IDs only need to be unique within one generator; the random prefix keeps
+        # them from repeating or being guessable across restarts
+        self._prefix = secrets.token_hex(4)
+        self._booking_counter = itertools.count(1)
+        self._payment_counter = itertools.count(1)
+
+    def booking_id(self) -> str:
+        """Next booking ID"""
+        return f"bk_{self._prefix}_{next(self._booking_counter):08x}"
+
+    def payment_id(self) -> str:
+        """Next payment ID"""
+        return f"pm_{self._prefix}_{next(self._payment_counter):08x}"
+
+
+def encode_seat_map_template(
+    encode: Callable[[Any], bytes],
+    header: Dict[str, Any],
+    seats: List[Dict[str, Any]]
+) -> SeatMapTemplate:
+    """Encode a seat map response with each seat's is_available left out"""
+    # Seat maps only vary in is_available, so everything else is encoded up front
+    head = encode(header)[:-1] + b',"seat_map":['
+    seat_templates = []
+    for seat in seats:
+        before = encode({"seat_number": seat["seat_number"], "row": seat["row"], "column": seat["column"]})
+        after = encode({"price_tier": seat["price_tier"], "price": seat.get("price", 15.00)})
+        seat_templates.append((seat["seat_number"], before[:-1] + b',"is_available":', b"," + after[1:]))
+    return head, seat_templates
+
+
+def render_seat_map(template: SeatMapTemplate, booked: Set[str]) -> bytes:
+    """Splice each seat's availability into its pre-encoded template"""
+    head, seat_templates = template
+    return head + b",".join(
+        before + (b"false" if seat_number in booked else b"true") + after
+        for seat_number, before, after in seat_templates
+    ) + b"]}"
+
+
+class MovieSearch:
+    """Substring search over lowercased movie genres and descriptions
+
+    Matches are positions in the list the index was built from, so each server
+    keeps its own response entries in the same order
+    """
+
+    def __init__(self, entries: List[Tuple[str, str]]):
+        self.entries = entries  # (genre_lower, description_lower) per movie
+
+        # One pass over the catalog: each distinct genre string and each \w+ run
+        # of a genre or description maps to the movies that contain it exactly
+        self._genre_postings: Dict[str, Set[int]] = {}
+        self._word_postings: Dict[str, Set[int]] = {}
+        for i, (genre_lower, description_lower) in enumerate(entries):
+            self._genre_postings.setdefault(genre_lower, set()).add(i)
+            for word in _WORD_RE.findall(genre_lower):
+                self._word_postings.setdefault(word, set()).add(i)
+            for word in _WORD_RE.findall(description_lower):
+                self._word_postings.setdefault(word, set()).add(i)
+
+        # Substring lookups are resolved against the postings on first use
+        self._genre_lookup = lru_cache(maxsize=1024)(self._movies_with_genre)
+        self._word_lookup = lru_cache(maxsize=4096)(self._movies_with_word)
+
+    def _movies_with_genre(self, genre: str) -> FrozenSet[int]:
+        """Positions of movies whose genre contains genre"""
+        return frozenset(itertools.chain.from_iterable(
+            positions for genre_lower, positions in self._genre_postings.items()
+            if genre in genre_lower
+        ))
+
+    def _movies_with_word(self, word: str) -> FrozenSet[int]:
+        """Positions of movies whose genre or description contains word, a run of word characters"""
+        # A run of word characters can only occur inside a single maximal run
+        # of the text, so the movies containing it are those holding any
+        # indexed word it is a substring of
+        return frozenset(itertools.chain.from_iterable(
+            positions for indexed, positions in self._word_postings.items()
+            if word in indexed
+        ))
+
+    def genre_matches(self, genre: str) -> FrozenSet[int]:
+        """Positions of movies whose genre contains the lowercased genre"""
+        return self._genre_lookup(genre)
+
+    def mood_matches(self, mood: str) -> Set[int]:
+        """Positions of movies whose genre or description contains the lowercased mood"""
+        words = _WORD_RE.findall(mood)
+        if words:
+            # Only movies containing every word can contain the whole phrase
+            candidates = frozenset.intersection(*(self._word_lookup(word) for word in words))
+        else:
+            candidates = range(len(self.entries))
+        return {
+            i for i in candidates
+            if mood in self.entries[i][1] or mood in self.entries[i][0]
+        }
@@ -0,0 +1,323 @@
+"""
+Mock data as Python literals, generated from data/*.json by scripts/gen_mock_data.py
+Do not edit by hand: edit the JSON files and re-run the script
+"""
+
+MOVIES = [{'movie_id': 'mv001',
+  'title': 'Dune: Part Two',
+  'rating': 'PG-13',
+  'duration': 166,
+  'genre': 'Sci-Fi/Action',
+  'description': 'Paul Atreides unites with Chani and the Fremen while seeking revenge against the '
+                 'conspirators who destroyed his family.',
+  'poster_url': 'https://example.com/posters/dune2.jpg'},
+ {'movie_id': 'mv002',
+  'title': 'Oppenheimer',
+  'rating': 'R',
+  'duration': 180,
+  'genre': 'Biography/Drama',
+  'description': 'The story of American scientist J. Robert Oppenheimer and his role in the '
+                 'development of the atomic bomb.',
+  'poster_url': 'https://example.com/posters/oppenheimer.jpg'},
+ {'movie_id': 'mv003',
+  'title': 'Spider-Man: Across the Spider-Verse',
+  'rating': 'PG',
+  'duration': 140,
+  'genre': 'Animation/Action',
+  'description': 'Miles Morales catapults across the Multiverse, where he encounters a team of '
+                 'Spider-People.',
+  'poster_url': 'https://example.com/posters/spiderverse.jpg'},
+ {'movie_id': 'mv004',
+  'title': 'John Wick: Chapter 4',
+  'rating': 'R',
+  'duration': 169,
+  'genre': 'Action/Thriller',
+  'description': 'John Wick discovers a way to defeat The High Table. But before he can earn his '
+                 'freedom, Wick must face off against a new enemy.',
+  'poster_url': 'https://example.com/posters/johnwick4.jpg'},
+ {'movie_id': 'mv005',
+  'title': 'The Little Mermaid',
+  'rating': 'PG',
+  'duration': 135,
+  'genre': 'Fantasy/Musical',
+  'description': 'A young mermaid makes a deal with a sea witch to trade her beautiful voice for '
+                 'human legs.',
+  'poster_url': 'https://example.com/posters/littlemermaid.jpg'},
+ {'movie_id': 'mv006',
+  'title': 'Fast X',
+  'rating': 'PG-13',
+  'duration': 141,
+  'genre': 'Action/Adventure',
+  'description': 'Dom Toretto and his family are targeted by the vengeful son of drug kingpin '
+                 'Hernan Reyes.',
+  'poster_url': 'https://example.com/posters/fastx.jpg'},
+ {'movie_id': 'mv007',
+  'title': 'Guardians of the Galaxy Vol. 3',
+  'rating': 'PG-13',
+  'duration': 150,
+  'genre': 'Action/Comedy',
+  'description': 'Still reeling from the loss of Gamora, Peter Quill rallies his team to defend '
+                 'the universe.',
+  'poster_url': 'https://example.com/posters/gotg3.jpg'},
+ {'movie_id': 'mv008',
+  'title': 'Indiana Jones and the Dial of Destiny',
+  'rating': 'PG-13',
+  'duration': 154,
+  'genre': 'Adventure/Action',
+  'description': 'Aging archaeologist Indiana Jones races against time to retrieve a legendary '
+                 'artifact.',
+  'poster_url': 'https://example.com/posters/indy5.jpg'},
+ {'movie_id': 'mv009',
+  'title': 'The Super Mario Bros. Movie',
+  'rating': 'PG',
+  'duration': 92,
+  'genre': 'Animation/Family',
+  'description': 'A plumber named Mario travels through an underground labyrinth with his brother '
+                 'Luigi.',
+  'poster_url': 'https://example.com/posters/mario.jpg'},
+ {'movie_id': 'mv010',
+  'title': 'Scream VI',
+  'rating': 'R',
+  'duration': 123,
+  'genre': 'Horror/Mystery',
+  'description': 'The survivors of the Ghostface killings leave Woodsboro behind and start a fresh '
+                 'chapter in New York City.',
+  'poster_url': 'https://example.com/posters/scream6.jpg'}]
+
+THEATERS = [{'theater_id': 'th001',
+  'name': 'AMC Boston Common 19',
+  'address': '175 Tremont Street',
+  'city': 'Boston',
+  'state': 'MA',
+  'zip_code': '02111'},
+ {'theater_id': 'th002',
+  'name': 'AMC Assembly Row 12',
+  'address': '395 Artisan Way',
+  'city': 'Somerville',
+  'state': 'MA',
+  'zip_code': '02145'},
+ {'theater_id': 'th003',
+  'name': 'AMC Liberty Tree Mall 20',
+  'address': '100 Independence Way',
+  'city': 'Danvers',
+  'state': 'MA',
+  'zip_code': '01923'},
+ {'theater_id': 'th004',
+  'name': 'AMC Braintree 10',
+  'address': '250 Granite Street',
+  'city': 'Braintree',
+  'state': 'MA',
+  'zip_code': '02184'},
+ {'theater_id': 'th005',
+  'name': 'AMC Burlington 10',
+  'address': '20 South Avenue',
+  'city': 'Burlington',
+  'state': 'MA',
+  'zip_code': '01803'},
+ {'theater_id': 'th006',
+  'name': 'AMC Empire 25',
+  'address': '234 W 42nd Street',
+  'city': 'New York',
+  'state': 'NY',
+  'zip_code': '10036'},
+ {'theater_id': 'th007',
+  'name': 'AMC Lincoln Square 13',
+  'address': '1998 Broadway',
+  'city': 'New York',
+  'state': 'NY',
+  'zip_code': '10023'},
+ {'theater_id': 'th008',
+  'name': 'AMC Century City 15',
+  'address': '10250 Santa Monica Blvd',
+  'city': 'Los Angeles',
+  'state': 'CA',
+  'zip_code': '90067'},
+ {'theater_id': 'th009',
+  'name': 'AMC The Grove 14',
+  'address': '189 The Grove Drive',
+  'city': 'Los Angeles',
+  'state': 'CA',
+  'zip_code': '90036'},
+ {'theater_id': 'th010',
+  'name': 'AMC River East 21',
+  'address': '322 E Illinois Street',
+  'city': 'Chicago',
+  'state': 'IL',
+  'zip_code': '60611'}]
+
+SHOWTIMES = [{'showtime_id': 'st001',
+  'movie_id': 'mv001',
+  'theater_id': 'th001',
+  'date': '2025-10-28',
+  'time': '14:00',
+  'format': 'IMAX',
+  'price': 18.5},
+ {'showtime_id': 'st002',
+  'movie_id': 'mv001',
+  'theater_id': 'th001',
+  'date': '2025-10-28',
+  'time': '17:30',
+  'format': 'Standard',
+  'price': 15.0},
+ {'showtime_id': 'st003',
+  'movie_id': 'mv001',
+  'theater_id': 'th001',
+  'date': '2025-10-28',
+  'time': '20:45',
+  'format': 'Dolby',
+  'price': 17.0},
+ {'showtime_id': 'st004',
+  'movie_id': 'mv002',
+  'theater_id': 'th001',
+  'date': '2025-10-28',
+  'time': '15:00',
+  'format': 'Standard',
+  'price': 15.0},
+ {'showtime_id': 'st005',
+  'movie_id': 'mv002',
+  'theater_id': 'th001',
+  'date': '2025-10-28',
+  'time': '19:00',
+  'format': 'IMAX',
+  'price': 18.5},
+ {'showtime_id': 'st006',
+  'movie_id': 'mv003',
+  'theater_id': 'th002',
+  'date': '2025-10-28',
+  'time': '13:30',
+  'format': '3D',
+  'price': 16.5},
+ {'showtime_id': 'st007',
+  'movie_id': 'mv003',
+  'theater_id': 'th002',
+  'date': '2025-10-28',
+  'time': '16:00',
+  'format': 'Standard',
+  'price': 15.0},
+ {'showtime_id': 'st008',
+  'movie_id': 'mv004',
+  'theater_id': 'th002',
+  'date': '2025-10-28',
+  'time': '18:30',
+  'format': 'Standard',
+  'price': 15.0},
+ {'showtime_id': 'st009',
+  'movie_id': 'mv005',
+  'theater_id': 'th003',
+  'date': '2025-10-28',
+  'time': '14:15',
+  'format': 'Standard',
+  'price': 12.0},
+ {'showtime_id': 'st010',
+  'movie_id': 'mv006',
+  'theater_id': 'th003',
+  'date': '2025-10-28',
+  'time': '21:00',
+  'format': 'Standard',
+  'price': 15.0},
+ {'showtime_id': 'st011',
+  'movie_id': 'mv001',
+  'theater_id': 'th002',
+  'date': '2025-10-29',
+  'time': '19:30',
+  'format': 'IMAX',
+  'price': 18.5},
+ {'showtime_id': 'st012',
+  'movie_id': 'mv007',
+  'theater_id': 'th004',
+  'date': '2025-10-28',
+  'time': '16:45',
+  'format': 'Standard',
+  'price': 15.0},
+ {'showtime_id': 'st013',
+  'movie_id': 'mv008',
+  'theater_id': 'th004',
+  'date': '2025-10-28',
+  'time': '20:00',
+  'format': 'Standard',
+  'price': 15.0},
+ {'showtime_id': 'st014',
+  'movie_id': 'mv009',
+  'theater_id': 'th005',
+  'date': '2025-10-28',
+  'time': '12:00',
+  'format': 'Standard',
+  'price': 12.0},
+ {'showtime_id': 'st015',
+  'movie_id': 'mv010',
+  'theater_id': 'th005',
+  'date': '2025-10-28',
+  'time': '22:30',
+  'format': 'Standard',
+  'price': 15.0}]
+
+SEATS = {'st001': [{'seat_number': 'A1', 'row': 'A', 'column': 1, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A2', 'row': 'A', 'column': 2, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A3', 'row': 'A', 'column': 3, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A4', 'row': 'A', 'column': 4, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A5', 'row': 'A', 'column': 5, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A6', 'row': 'A', 'column': 6, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A7', 'row': 'A', 'column': 7, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A8', 'row': 'A', 'column': 8, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B1', 'row': 'B', 'column': 1, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B2', 'row': 'B', 'column': 2, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B3', 'row': 'B', 'column': 3, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B4', 'row': 'B', 'column': 4, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B5', 'row': 'B', 'column': 5, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B6', 'row': 'B', 'column': 6, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B7', 'row': 'B', 'column': 7, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B8', 'row': 'B', 'column': 8, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'C1', 'row': 'C', 'column': 1, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'C2', 'row': 'C', 'column': 2, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'C3', 'row': 'C', 'column': 3, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'C4', 'row': 'C', 'column': 4, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'C5', 'row': 'C', 'column': 5, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'C6', 'row': 'C', 'column': 6, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'C7', 'row': 'C', 'column': 7, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'C8', 'row': 'C', 'column': 8, 'price_tier': 'Premium', 'price': 21.5}],
+ 'st002': [{'seat_number': 'A1', 'row': 'A', 'column': 1, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A2', 'row': 'A', 'column': 2, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A3', 'row': 'A', 'column': 3, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A4', 'row': 'A', 'column': 4, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A5', 'row': 'A', 'column': 5, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A6', 'row': 'A', 'column': 6, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B1', 'row': 'B', 'column': 1, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B2', 'row': 'B', 'column': 2, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B3', 'row': 'B', 'column': 3, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B4', 'row': 'B', 'column': 4, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B5', 'row': 'B', 'column': 5, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B6', 'row': 'B', 'column': 6, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'C1', 'row': 'C', 'column': 1, 'price_tier': 'Recliner', 'price': 18.0},
+           {'seat_number': 'C2', 'row': 'C', 'column': 2, 'price_tier': 'Recliner', 'price': 18.0},
+           {'seat_number': 'C3', 'row': 'C', 'column': 3, 'price_tier': 'Recliner', 'price': 18.0},
+           {'seat_number': 'C4', 'row': 'C', 'column': 4, 'price_tier': 'Recliner', 'price': 18.0}],
+ 'st003': [{'seat_number': 'A1', 'row': 'A', 'column': 1, 'price_tier': 'Standard', 'price': 17.0},
+           {'seat_number': 'A2', 'row': 'A', 'column': 2, 'price_tier': 'Standard', 'price': 17.0},
+           {'seat_number': 'A3', 'row': 'A', 'column': 3, 'price_tier': 'Standard', 'price': 17.0},
+           {'seat_number': 'A4', 'row': 'A', 'column': 4, 'price_tier': 'Standard', 'price': 17.0},
+           {'seat_number': 'A5', 'row': 'A', 'column': 5, 'price_tier': 'Standard', 'price': 17.0},
+           {'seat_number': 'A6', 'row': 'A', 'column': 6, 'price_tier': 'Standard', 'price': 17.0},
+           {'seat_number': 'B1', 'row': 'B', 'column': 1, 'price_tier': 'Premium', 'price': 20.0},
+           {'seat_number': 'B2', 'row': 'B', 'column': 2, 'price_tier': 'Premium', 'price': 20.0},
+           {'seat_number': 'B3', 'row': 'B', 'column': 3, 'price_tier': 'Premium', 'price': 20.0},
+           {'seat_number': 'B4', 'row': 'B', 'column': 4, 'price_tier': 'Premium', 'price': 20.0},
+           {'seat_number': 'B5', 'row': 'B', 'column': 5, 'price_tier': 'Premium', 'price': 20.0},
+           {'seat_number': 'B6', 'row': 'B', 'column': 6, 'price_tier': 'Premium', 'price': 20.0}],
+ 'st004': [{'seat_number': 'A1', 'row': 'A', 'column': 1, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A2', 'row': 'A', 'column': 2, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A3', 'row': 'A', 'column': 3, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A4', 'row': 'A', 'column': 4, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A5', 'row': 'A', 'column': 5, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'A6', 'row': 'A', 'column': 6, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B1', 'row': 'B', 'column': 1, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B2', 'row': 'B', 'column': 2, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B3', 'row': 'B', 'column': 3, 'price_tier': 'Standard', 'price': 15.0},
+           {'seat_number': 'B4', 'row': 'B', 'column': 4, 'price_tier': 'Standard', 'price': 15.0}],
+ 'st005': [{'seat_number': 'A1', 'row': 'A', 'column': 1, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A2', 'row': 'A', 'column': 2, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A3', 'row': 'A', 'column': 3, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'A4', 'row': 'A', 'column': 4, 'price_tier': 'Standard', 'price': 18.5},
+           {'seat_number': 'B1', 'row': 'B', 'column': 1, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'B2', 'row': 'B', 'column': 2, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'B3', 'row': 'B', 'column': 3, 'price_tier': 'Premium', 'price': 21.5},
+           {'seat_number': 'B4', 'row': 'B', 'column': 4, 'price_tier': 'Premium', 'price': 21.5}]}
@@ -2,15 +2,23 @@
 AMC MCP Server - FastMCP Implementation
 A comprehensive movie booking server using FastMCP
 """
-import json
 import logging
-import uuid
-from datetime import datetime
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import orjson
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
+
+from amc_mcp._common import (
+    IdGenerator,
+    MovieSearch,
+    SeatMapTemplate,
+    encode_seat_map_template,
+    now_iso,
+    render_seat_map,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,7 +28,10 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("amc-mcp")
 
 # Data models
-class Movie(BaseModel):
+# Records are built from trusted data or validated tool arguments, so they are
+# plain slotted dataclasses rather than Pydantic models
+@dataclass(slots=True)
+class Movie:
     movie_id: str
     title: str
     rating: str
@@ -29,7 +40,8 @@ class Movie(BaseModel):
     description: str
     poster_url: str
 
-class Theater(BaseModel):
+@dataclass(slots=True)
+class Theater:
     theater_id: str
     name: str
     address: str
@@ -37,7 +49,8 @@ class Theater(BaseModel):
     state: str
     zip_code: str
 
-class Showtime(BaseModel):
+@dataclass(slots=True)
+class Showtime:
     showtime_id: str
     movie_id: str
     theater_id: str
@@ -46,7 +59,8 @@ class Showtime(BaseModel):
     format: str
     price: float
 
-class Booking(BaseModel):
+@dataclass(slots=True)
+class Booking:
     booking_id: str
     showtime_id: str
     seats: List[str]
@@ -55,7 +69,8 @@ class Booking(BaseModel):
     total_price: float
     created_at: str
 
-class Payment(BaseModel):
+@dataclass(slots=True)
+class Payment:
     payment_id: str
     booking_id: str
     amount: float
@@ -70,37 +85,143 @@ showtimes: Dict[str, Showtime] = {}
 seats_data: Dict[str, List[Dict]] = {}
 bookings: Dict[str, Booking] = {}
 payments: Dict[str, Payment] = {}
+confirmed_seats: Dict[str, Set[str]] = {}  # showtime_id -> seat numbers with a confirmed booking
+_NO_SEATS: frozenset = frozenset()
+
+_ids = IdGenerator()
+
+# Lookup indexes built by load_mock_data
+showtimes_by_movie_date: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}  # listed showtimes, joined with their theater
+movie_search_index: List[Tuple[str, str, Dict[str, Any]]] = []  # (genre_lower, description_lower, recommendation)
+movie_search = MovieSearch([])  # matches are movie_search_index positions
+seat_prices: Dict[str, Dict[str, float]] = {}  # showtime_id -> seat_number -> price
+
+# Precomputed response fragments
+movie_view: Dict[str, Dict[str, Any]] = {}  # movie_id -> now-showing entry
+showtime_context: Dict[str, Dict[str, str]] = {}  # showtime_id -> movie/theater/date/time shown with seats and bookings
+seat_map_templates: Dict[str, SeatMapTemplate] = {}
+now_showing_json: str = "[]"
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to a compact JSON string"""
+    # FastMCP passes str results through as text content but would re-serialize
+    # bytes as a quoted JSON string, so the orjson output is decoded here.
+    # orjson's output is already UTF-8, so the decode is a single pass
+    return orjson.dumps(obj).decode()
+
+
+def _read_mock_data() -> Tuple[List[Dict], List[Dict], List[Dict], Dict[str, List[Dict]]]:
+    """Return the raw movie, theater, showtime and seat records"""
+    try:
+        # Literals generated by scripts/gen_mock_data.py skip JSON parsing entirely
+        from amc_mcp._mock_data import MOVIES, THEATERS, SHOWTIMES, SEATS
+        logger.info("Loading data from generated module amc_mcp._mock_data")
+        return MOVIES, THEATERS, SHOWTIMES, SEATS
+    except ImportError:
+        pass
+    
+    # Get the data directory path
+    data_dir = Path(__file__).parent.parent.parent / "data"
+    logger.info(f"Loading data from: {data_dir}")
+    
+    return (
+        orjson.loads((data_dir / "movies.json").read_bytes()),
+        orjson.loads((data_dir / "theaters.json").read_bytes()),
+        orjson.loads((data_dir / "showtimes.json").read_bytes()),
+        orjson.loads((data_dir / "seats.json").read_bytes()),
+    )
+
 
 def load_mock_data():
-    """Load mock data from JSON files"""
+    """Load mock data from the generated data module, or the JSON files if it is missing"""
     global movies, theaters, showtimes, seats_data
+    global showtimes_by_movie_date, movie_search_index, movie_search, seat_prices
+    global movie_view, showtime_context, seat_map_templates, now_showing_json
     
     try:
-        # Get the data directory path
-        data_dir = Path(__file__).parent.parent.parent / "data"
-        logger.info(f"Loading data from: {data_dir}")
+        movies_list, theaters_list, showtimes_list, seats_data = _read_mock_data()
+        movies = {m["movie_id"]: Movie(**m) for m in movies_list}
+        theaters = {t["theater_id"]: Theater(**t) for t in theaters_list}
+        showtimes = {s["showtime_id"]: Showtime(**s) for s in showtimes_list}
         
-        with open(data_dir / "movies.json", "r") as f:
-            movies_list = json.load(f)
-            movies = {m["movie_id"]: Movie(**m) for m in movies_list}
+        seat_prices = {
+            showtime_id: {s["seat_number"]: s.get("price", 15.00) for s in seat_list}
+            for showtime_id, seat_list in seats_data.items()
+        }
         
-        with open(data_dir / "theaters.json", "r") as f:
-            theaters_list = json.load(f)
-            theaters = {t["theater_id"]: Theater(**t) for t in theaters_list}
+        movie_search_index = [
+            (
+                movie.genre.lower(),
+                movie.description.lower(),
+                {
+                    "movie_id": movie.movie_id,
+                    "title": movie.title,
+                    "genre": movie.genre,
+                    "description": movie.description,
+                    "rating": movie.rating
+                }
+            )
+            for movie in movies.values()
+        ]
         
-        with open(data_dir / "showtimes.json", "r") as f:
-            showtimes_list = json.load(f)
-            showtimes = {s["showtime_id"]: Showtime(**s) for s in showtimes_list}
+        movie_search = MovieSearch([(genre, description) for genre, description, _ in movie_search_index])
         
-        with open(data_dir / "seats.json", "r") as f:
-            seats_data = json.load(f)
+        movie_view = {
+            movie.movie_id: {
+                "movie_id": movie.movie_id,
+                "title": movie.title,
+                "rating": movie.rating,
+                "duration": movie.duration,
+                "genre": movie.genre,
+                "description": movie.description
+            }
+            for movie in movies.values()
+        }
+        
+        # Showtimes are joined with their theater up front; those at unknown
+        # theaters are never listed, so they are left out of the index
+        showtimes_by_movie_date = {}
+        for showtime in showtimes.values():
+            theater = theaters.get(showtime.theater_id)
+            if theater:
+                key = (showtime.movie_id, showtime.date)
+                showtimes_by_movie_date.setdefault(key, []).append({
+                    "showtime_id": showtime.showtime_id,
+                    "theater_name": theater.name,
+                    "theater_address": theater.address,
+                    "time": showtime.time,
+                    "format": showtime.format,
+                    "price": showtime.price
+                })
+        
+        showtime_context = {}
+        for showtime in showtimes.values():
+            movie = movies.get(showtime.movie_id)
+            theater = theaters.get(showtime.theater_id)
+            showtime_context[showtime.showtime_id] = {
+                "movie": movie.title if movie else "Unknown",
+                "theater": theater.name if theater else "Unknown Theater",
+                "date": showtime.date,
+                "time": showtime.time
+            }
+        
+        seat_map_templates = {
+            showtime_id: encode_seat_map_template(
+                orjson.dumps, {"showtime_id": showtime_id, **context}, seats_data.get(showtime_id, [])
+            )
+            for showtime_id, context in showtime_context.items()
+        }
+        
+        # Encode the now-showing movie list once; it is the same for every location
+        now_showing_json = _dumps(list(movie_view.values())[:10])
         
         logger.info(f"Loaded {len(movies)} movies, {len(theaters)} theaters, {len(showtimes)} showtimes")
     except Exception as e:
         logger.error(f"Error loading mock data: {e}")
-
-# Load data on module import
-load_mock_data()
+    
+    # Cached recommendations belong to the previous catalog
+    _get_recommendations.cache_clear()
 
 
 def _get_now_showing(location: str) -> str:
@@ -113,24 +234,8 @@ def _get_now_showing(location: str) -> str:
     Returns:
         JSON string with list of movies
     """
-    showing_movies = []
-    for movie in movies.values():
-        movie_data = {
-            "movie_id": movie.movie_id,
-            "title": movie.title,
-            "rating": movie.rating,
-            "duration": movie.duration,
-            "genre": movie.genre,
-            "description": movie.description
-        }
-        showing_movies.append(movie_data)
-    
-    result = {
-        "location": location,
-        "movies": showing_movies[:10]
-    }
-    
-    return json.dumps(result, indent=2)
+    # Only the location echo is encoded per request
+    return f'{{"location":{_dumps(location)},"movies":{now_showing_json}}}'
 
 
 @mcp.tool()
@@ -147,54 +252,38 @@ def get_now_showing(location: str) -> str:
     return _get_now_showing(location)
 
 
+@lru_cache(maxsize=256)
 def _get_recommendations(
     genre: Optional[str] = None,
     mood: Optional[str] = None,
     time_preference: Optional[str] = None
 ) -> str:
-    """Get movie recommendations based on preferences"""
-    recommendations = []
+    """
+    Get movie recommendations based on preferences.
     
+    The result depends only on the arguments and the catalog, so responses
+    are memoized until load_mock_data() reloads it.
+    """
     genre_lower = genre.lower() if genre else ""
     mood_lower = mood.lower() if mood else ""
     
-    for movie in movies.values():
-        if genre_lower and genre_lower in movie.genre.lower():
-            recommendations.append({
-                "movie_id": movie.movie_id,
-                "title": movie.title,
-                "genre": movie.genre,
-                "description": movie.description,
-                "rating": movie.rating
-            })
-        elif mood_lower and (mood_lower in movie.description.lower() or mood_lower in movie.genre.lower()):
-            recommendations.append({
-                "movie_id": movie.movie_id,
-                "title": movie.title,
-                "genre": movie.genre,
-                "description": movie.description,
-                "rating": movie.rating
-            })
+    matches = set()
+    if genre_lower:
+        matches.update(movie_search.genre_matches(genre_lower))
+    if mood_lower:
+        matches.update(movie_search.mood_matches(mood_lower))
+    recommendations = [movie_search_index[i][2] for i in sorted(matches)]
     
     if not recommendations and not genre and not mood:
         # Return top picks if no specific criteria
-        recommendations = [
-            {
-                "movie_id": movie.movie_id,
-                "title": movie.title,
-                "genre": movie.genre,
-                "description": movie.description,
-                "rating": movie.rating
-            }
-            for movie in list(movies.values())[:5]
-        ]
+        recommendations = [entry[2] for entry in movie_search_index[:5]]
     
     result = {
         "criteria": {"genre": genre, "mood": mood, "time_preference": time_preference},
         "recommendations": recommendations[:5]
     }
     
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -221,32 +310,18 @@ def get_recommendations(
 def _get_showtimes(movie_id: str, date: str, location: str) -> str:
     """Internal implementation of get_showtimes"""
     if not movie_id or movie_id not in movies:
-        return json.dumps({"error": "Invalid movie ID"})
+        return _dumps({"error": "Invalid movie ID"})
     
     movie = movies[movie_id]
-    showtime_list = []
-    
-    for showtime in showtimes.values():
-        if showtime.movie_id == movie_id and showtime.date == date:
-            theater = theaters.get(showtime.theater_id)
-            if theater:
-                showtime_list.append({
-                    "showtime_id": showtime.showtime_id,
-                    "theater_name": theater.name,
-                    "theater_address": theater.address,
-                    "time": showtime.time,
-                    "format": showtime.format,
-                    "price": showtime.price
-                })
     
     result = {
         "movie": {"id": movie.movie_id, "title": movie.title},
         "date": date,
         "location": location,
-        "showtimes": showtime_list
+        "showtimes": showtimes_by_movie_date.get((movie_id, date), [])
     }
     
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -270,43 +345,10 @@ def get_showtimes(movie_id: str, date: str, location: str) -> str:
 def _get_seat_map(showtime_id: str) -> str:
     """Internal implementation of get_seat_map"""
     if not showtime_id or showtime_id not in showtimes:
-        return json.dumps({"error": "Invalid showtime ID"})
-    
-    # Get seats for this showtime
-    seats = seats_data.get(showtime_id, [])
-    seat_map = []
-    
-    for seat_data in seats:
-        # Check if seat is already booked
-        is_booked = any(
-            seat_data["seat_number"] in booking.seats and booking.status == "confirmed"
-            for booking in bookings.values()
-            if booking.showtime_id == showtime_id
-        )
-        
-        seat_map.append({
-            "seat_number": seat_data["seat_number"],
-            "row": seat_data["row"],
-            "column": seat_data["column"],
-            "is_available": not is_booked,
-            "price_tier": seat_data["price_tier"],
-            "price": seat_data.get("price", 15.00)
-        })
-    
-    showtime = showtimes[showtime_id]
-    theater = theaters.get(showtime.theater_id)
-    movie = movies.get(showtime.movie_id)
+        return _dumps({"error": "Invalid showtime ID"})
     
-    result = {
-        "showtime_id": showtime_id,
-        "movie": movie.title if movie else "Unknown",
-        "theater": theater.name if theater else "Unknown Theater",
-        "date": showtime.date,
-        "time": showtime.time,
-        "seat_map": seat_map
-    }
-    
-    return json.dumps(result, indent=2)
+    booked = confirmed_seats.get(showtime_id, _NO_SEATS)
+    return render_seat_map(seat_map_templates[showtime_id], booked).decode()
 
 
 @mcp.tool()
@@ -328,42 +370,32 @@ def get_seat_map(showtime_id: str) -> str:
 def _book_seats(showtime_id: str, seats: List[str], user_id: str) -> str:
     """Internal implementation of book_seats"""
     if not showtime_id or showtime_id not in showtimes:
-        return json.dumps({"error": "Invalid showtime ID"})
+        return _dumps({"error": "Invalid showtime ID"})
     
     if not seats or not user_id:
-        return json.dumps({"error": "Seats and user_id are required"})
+        return _dumps({"error": "Seats and user_id are required"})
     
     # Check seat availability
     unavailable_seats = []
     total_price = 0.0
     
-    showtime_seats = seats_data.get(showtime_id, [])
-    seat_lookup = {s["seat_number"]: s for s in showtime_seats}
+    prices = seat_prices.get(showtime_id, {})
+    booked = confirmed_seats.get(showtime_id, _NO_SEATS)
     
     for seat_num in seats:
-        # Check if seat exists
-        if seat_num not in seat_lookup:
+        seat_price = prices.get(seat_num)
+        if seat_price is None:
             unavailable_seats.append(f"{seat_num} (doesn't exist)")
-            continue
-        
-        # Check if already booked
-        is_booked = any(
-            seat_num in booking.seats and booking.status == "confirmed"
-            for booking in bookings.values()
-            if booking.showtime_id == showtime_id
-        )
-        
-        if is_booked:
+        elif seat_num in booked:
             unavailable_seats.append(f"{seat_num} (already booked)")
         else:
-            seat_price = seat_lookup[seat_num].get("price", 15.00)
             total_price += seat_price
     
     if unavailable_seats:
-        return json.dumps({"error": f"Unavailable seats: {', '.join(unavailable_seats)}"})
+        return _dumps({"error": f"Unavailable seats: {', '.join(unavailable_seats)}"})
     
     # Create booking
-    booking_id = str(uuid.uuid4())
+    booking_id = _ids.booking_id()
     booking = Booking(
         booking_id=booking_id,
         showtime_id=showtime_id,
@@ -371,27 +403,20 @@ def _book_seats(showtime_id: str, seats: List[str], user_id: str) -> str:
         user_id=user_id,
         status="pending",
         total_price=total_price,
-        created_at=datetime.now().isoformat()
+        created_at=now_iso()
     )
     
     bookings[booking_id] = booking
     
-    showtime = showtimes[showtime_id]
-    theater = theaters.get(showtime.theater_id)
-    movie = movies.get(showtime.movie_id)
-    
     result = {
         "booking_id": booking_id,
         "status": "pending",
-        "movie": movie.title if movie else "Unknown",
-        "theater": theater.name if theater else "Unknown Theater",
-        "date": showtime.date,
-        "time": showtime.time,
+        **showtime_context[showtime_id],
         "seats": seats,
         "total_price": total_price
     }
     
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -413,18 +438,18 @@ def book_seats(showtime_id: str, seats: List[str], user_id: str) -> str:
 def _process_payment(booking_id: str, payment_method: str, amount: float) -> str:
     """Internal implementation of process_payment"""
     if not booking_id or booking_id not in bookings:
-        return json.dumps({"error": "Invalid booking ID"})
+        return _dumps({"error": "Invalid booking ID"})
     
     booking = bookings[booking_id]
     
     if booking.status != "pending":
-        return json.dumps({"error": f"Booking status is {booking.status}, expected pending"})
+        return _dumps({"error": f"Booking status is {booking.status}, expected pending"})
     
     if abs(amount - booking.total_price) > 0.01:
-        return json.dumps({"error": f"Amount mismatch. Expected ${booking.total_price:.2f}, got ${amount:.2f}"})
+        return _dumps({"error": f"Amount mismatch. Expected ${booking.total_price:.2f}, got ${amount:.2f}"})
     
     # Simulate payment processing (always succeeds in mock)
-    payment_id = str(uuid.uuid4())
+    payment_id = _ids.payment_id()
     receipt_url = f"https://amc.com/receipts/{payment_id}"
     
     payment = Payment(
@@ -440,10 +465,7 @@ def _process_payment(booking_id: str, payment_method: str, amount: float) -> str
     
     # Update booking status
     booking.status = "confirmed"
-    
-    showtime = showtimes[booking.showtime_id]
-    theater = theaters.get(showtime.theater_id)
-    movie = movies.get(showtime.movie_id)
+    confirmed_seats.setdefault(booking.showtime_id, set()).update(booking.seats)
     
     result = {
         "payment_id": payment_id,
@@ -451,16 +473,13 @@ def _process_payment(booking_id: str, payment_method: str, amount: float) -> str
         "booking_id": booking_id,
         "receipt_url": receipt_url,
         "confirmation": {
-            "movie": movie.title if movie else "Unknown",
-            "theater": theater.name if theater else "Unknown Theater",
-            "date": showtime.date,
-            "time": showtime.time,
+            **showtime_context[booking.showtime_id],
             "seats": booking.seats,
             "total_paid": amount
         }
     }
     
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -479,6 +498,10 @@ def process_payment(booking_id: str, payment_method: str, amount: float) -> str:
     return _process_payment(booking_id, payment_method, amount)
 
 
+# Load data on module import, once every tool is defined
+load_mock_data()
+
+
 def main():
     """Run the MCP server"""
     logger.info("Starting AMC MCP Server with FastMCP...")
@@ -2,14 +2,16 @@
 AMC MCP Server - Main server implementation
 """
 import asyncio
-import json
 import logging
+import os
 import sys
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+import msgspec
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -21,7 +23,15 @@ from mcp.types import (
     TextContent,
     EmbeddedResource
 )
-from pydantic import BaseModel, Field
+
+from amc_mcp._common import (
+    IdGenerator,
+    MovieSearch,
+    SeatMapTemplate,
+    encode_seat_map_template,
+    now_iso,
+    render_seat_map,
+)
 
 
 # Configure logging
@@ -29,7 +39,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Data models
-class Movie(BaseModel):
+class Movie(msgspec.Struct):
     movie_id: str
     title: str
     rating: str
@@ -38,7 +48,7 @@ class Movie(BaseModel):
     description: str
     poster_url: str
 
-class Theater(BaseModel):
+class Theater(msgspec.Struct):
     theater_id: str
     name: str
     address: str
@@ -46,7 +56,7 @@ class Theater(BaseModel):
     state: str
     zip_code: str
 
-class Showtime(BaseModel):
+class Showtime(msgspec.Struct):
     showtime_id: str
     movie_id: str
     theater_id: str
@@ -55,14 +65,16 @@ class Showtime(BaseModel):
     format: str  # "Standard", "IMAX", "3D", "Dolby"
     price: float
 
-class Seat(BaseModel):
+class Seat(msgspec.Struct):
     seat_number: str
     row: str
     column: int
     is_available: bool
     price_tier: str  # "Standard", "Premium", "Recliner"
 
-class Booking(BaseModel):
+# Bookings and payments accumulate for the life of the server and never form
+# reference cycles, so they are left out of garbage collector tracking
+class Booking(msgspec.Struct, gc=False):
     booking_id: str
     showtime_id: str
     seats: List[str]
@@ -71,7 +83,7 @@ class Booking(BaseModel):
     total_price: float
     created_at: str
 
-class Payment(BaseModel):
+class Payment(msgspec.Struct, gc=False):
     payment_id: str
     booking_id: str
     amount: float
@@ -80,143 +92,328 @@ class Payment(BaseModel):
     receipt_url: Optional[str] = None
 
 
+_NO_SEATS: frozenset = frozenset()
+
+
+_ENCODER = msgspec.json.Encoder()
+
+# Responses go out as compact JSON; set AMC_MCP_PRETTY to indent them for debugging
+_PRETTY = bool(os.environ.get("AMC_MCP_PRETTY"))
+
+
+def _json_text(data: bytes) -> TextContent:
+    """Wrap an encoded JSON response in MCP text content"""
+    # TextContent only carries str, and the stdio transport re-serializes the
+    # whole message model anyway, so the bytes can't be handed through as-is.
+    # The UTF-8 decode already takes CPython's ASCII fast path
+    if _PRETTY:
+        data = msgspec.json.format(data, indent=2)
+    return TextContent(type="text", text=data.decode())
+
+
+def _to_text(obj: Any) -> TextContent:
+    """Serialize a tool response into MCP text content"""
+    return _json_text(_ENCODER.encode(obj))
+
+
+class _Catalog:
+    """Mock data tables and the lookup indexes built from them
+    
+    A reload builds a whole new catalog and swaps it in with one assignment,
+    so requests never see tables and indexes from different loads
+    """
+    
+    def __init__(
+        self,
+        movies: Dict[str, Movie],
+        theaters: Dict[str, Theater],
+        showtimes: Dict[str, Showtime],
+        seats_data: Dict[str, List[Dict[str, Any]]]
+    ):
+        """Build lookup indexes over the given mock data"""
+        self.movies = movies
+        self.theaters = theaters
+        self.showtimes = showtimes
+        self.seats_data = seats_data
+        
+        # (movie_id, date) -> showtime entries already joined with their theater;
+        # showtimes at unknown theaters are never listed, so they are left out
+        self.showtimes_by_movie_date: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for showtime in self.showtimes.values():
+            theater = self.theaters.get(showtime.theater_id)
+            if theater:
+                key = (showtime.movie_id, showtime.date)
+                self.showtimes_by_movie_date.setdefault(key, []).append({
+                    "showtime_id": showtime.showtime_id,
+                    "theater_name": theater.name,
+                    "theater_address": theater.address,
+                    "time": showtime.time,
+                    "format": showtime.format,
+                    "price": showtime.price
+                })
+        
+        # Movie metadata never changes, so response entries are encoded once
+        # and spliced into responses as bytes
+        self.now_showing_json: bytes = b"[" + b",".join(
+            _ENCODER.encode({
+                "movie_id": m.movie_id,
+                "title": m.title,
+                "rating": m.rating,
+                "duration": m.duration,
+                "genre": m.genre,
+                "description": m.description
+            })
+            for m in list(self.movies.values())[:10]
+        ) + b"]"
+        
+        # (genre_lower, description_lower, encoded recommendation entry) so
+        # matching doesn't lowercase per request
+        self.movie_search: List[Tuple[str, str, bytes]] = [
+            (
+                m.genre.lower(),
+                m.description.lower(),
+                _ENCODER.encode({
+                    "movie_id": m.movie_id,
+                    "title": m.title,
+                    "genre": m.genre,
+                    "description": m.description,
+                    "rating": m.rating
+                })
+            )
+            for m in self.movies.values()
+        ]
+        
+        self.search = MovieSearch([(genre, description) for genre, description, _ in self.movie_search])
+        
+        # Recommendations depend only on (genre, mood) and this catalog, so
+        # each reload starts a fresh cache
+        self.cached_recommendations = lru_cache(maxsize=256)(self._recommendations_json)
+        
+        self.seat_map_templates: Dict[str, SeatMapTemplate] = {}
+        for showtime in self.showtimes.values():
+            theater = self.theaters.get(showtime.theater_id)
+            movie = self.movies.get(showtime.movie_id)
+            header = {
+                "showtime_id": showtime.showtime_id,
+                "movie": movie.title if movie else "Unknown",
+                "theater": theater.name if theater else "Unknown Theater",
+                "date": showtime.date,
+                "time": showtime.time
+            }
+            self.seat_map_templates[showtime.showtime_id] = encode_seat_map_template(
+                _ENCODER.encode, header, self.seats_data.get(showtime.showtime_id, [])
+            )
+        
+        # showtime_id -> seat_number -> price, with the default price filled in
+        self.seat_prices: Dict[str, Dict[str, float]] = {
+            showtime_id: {s["seat_number"]: s.get("price", 15.00) for s in seats}
+            for showtime_id, seats in self.seats_data.items()
+        }
+    
+    def _recommendations_json(self, genre: str, mood: str) -> bytes:
+        """Encode recommendations for lowercased genre and mood criteria"""
+        # Movies matching either criterion, in catalog order
+        matches: Set[int] = set()
+        if genre:
+            matches.update(self.search.genre_matches(genre))
+        if mood:
+            matches.update(self.search.mood_matches(mood))
+        recommendations = [self.movie_search[i][2] for i in sorted(matches)]
+        
+        if not recommendations and not genre and not mood:
+            # Return top picks if no specific criteria
+            recommendations = [movie_json for _, _, movie_json in self.movie_search[:5]]
+        
+        return (
+            b'{"criteria":' + _ENCODER.encode({"genre": genre, "mood": mood})
+            + b',"recommendations":[' + b",".join(recommendations[:5]) + b"]}"
+        )
+
+
 class AMCMCPServer:
     """AMC MCP Server implementation"""
     
     def __init__(self):
+        """Set up an empty server; use create() to get one with mock data loaded"""
         self.server = Server("amc-mcp")
         self.data_dir = Path(__file__).parent.parent.parent / "data"
+        self._catalog = _Catalog({}, {}, {}, {})
         self.bookings: Dict[str, Booking] = {}
         self.payments: Dict[str, Payment] = {}
-        self._load_mock_data()
+        self._booked_seats: Dict[str, Set[str]] = defaultdict(set)  # showtime_id -> confirmed seat numbers
+        self._ids = IdGenerator()
+        self._tool_dispatch = {
+            "get_now_showing": self._get_now_showing,
+            "get_recommendations": self._get_recommendations,
+            "get_showtimes": self._get_showtimes,
+            "get_seat_map": self._get_seat_map,
+            "book_seats": self._book_seats,
+            "process_payment": self._process_payment,
+        }
         self._setup_handlers()
     
-    def _load_mock_data(self):
-        """Load mock data from JSON files"""
+    @classmethod
+    async def create(cls) -> "AMCMCPServer":
+        """Create a server with its mock data loaded"""
+        server = cls()
+        await server._load_mock_data()
+        return server
+    
+    @property
+    def movies(self) -> Dict[str, Movie]:
+        """Movies in the current catalog, by movie_id"""
+        return self._catalog.movies
+    
+    @property
+    def theaters(self) -> Dict[str, Theater]:
+        """Theaters in the current catalog, by theater_id"""
+        return self._catalog.theaters
+    
+    @property
+    def showtimes(self) -> Dict[str, Showtime]:
+        """Showtimes in the current catalog, by showtime_id"""
+        return self._catalog.showtimes
+    
+    @property
+    def seats_data(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Seat data in the current catalog, by showtime_id"""
+        return self._catalog.seats_data
+    
+    async def _load_mock_data(self):
+        """Load mock data from JSON files without blocking the event loop"""
         try:
-            with open(self.data_dir / "movies.json", "r") as f:
-                self.movies = {m["movie_id"]: Movie(**m) for m in json.load(f)}
-            
-            with open(self.data_dir / "theaters.json", "r") as f:
-                self.theaters = {t["theater_id"]: Theater(**t) for t in json.load(f)}
-            
-            with open(self.data_dir / "showtimes.json", "r") as f:
-                self.showtimes = {s["showtime_id"]: Showtime(**s) for s in json.load(f)}
-            
-            with open(self.data_dir / "seats.json", "r") as f:
-                self.seats_data = json.load(f)
+            # The four files are read and decoded in parallel worker threads
+            movies, theaters, showtimes, seats_data = await asyncio.gather(
+                asyncio.to_thread(self._read_data_file, "movies.json", List[Movie]),
+                asyncio.to_thread(self._read_data_file, "theaters.json", List[Theater]),
+                asyncio.to_thread(self._read_data_file, "showtimes.json", List[Showtime]),
+                asyncio.to_thread(self._read_data_file, "seats.json", Dict[str, List[Dict[str, Any]]]),
+            )
+            tables = (
+                {m.movie_id: m for m in movies},
+                {t.theater_id: t for t in theaters},
+                {s.showtime_id: s for s in showtimes},
+                seats_data
+            )
                 
         except Exception as e:
             logger.error(f"Error loading mock data: {e}")
-            self.movies = {}
-            self.theaters = {}
-            self.showtimes = {}
-            self.seats_data = {}
+            tables = ({}, {}, {}, {})
+        
+        await self._install_catalog(*tables)
+    
+    async def _install_catalog(
+        self,
+        movies: Dict[str, Movie],
+        theaters: Dict[str, Theater],
+        showtimes: Dict[str, Showtime],
+        seats_data: Dict[str, List[Dict[str, Any]]]
+    ):
+        """Index new mock data off the event loop, then serve it"""
+        # Requests keep using the current catalog until the new one is complete
+        self._catalog = await asyncio.to_thread(_Catalog, movies, theaters, showtimes, seats_data)
+    
+    def _read_data_file(self, filename: str, data_type: Any) -> Any:
+        """Read one mock data file, decoding it straight into data_type"""
+        return msgspec.json.decode((self.data_dir / filename).read_bytes(), type=data_type)
     
     def _setup_handlers(self):
         """Setup MCP server handlers"""
         
+        # The tool list is static, so build it once and return the same result every call
+        self._tools_result = ListToolsResult(
+            tools=[
+                Tool(
+                    name="get_now_showing",
+                    description="Returns a list of movies currently showing in a given city or ZIP code",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "location": {"type": "string", "description": "City, state or ZIP code"}
+                        },
+                        "required": ["location"]
+                    }
+                ),
+                Tool(
+                    name="get_recommendations",
+                    description="Suggests movies based on mood, genre, or time preferences",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "genre": {"type": "string", "description": "Movie genre (optional)"},
+                            "mood": {"type": "string", "description": "Mood description (optional)"},
+                            "time_preference": {"type": "string", "description": "Time of day preference (optional)"}
+                        }
+                    }
+                ),
+                Tool(
+                    name="get_showtimes",
+                    description="Fetches available showtimes for a specific movie and location",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "movie_id": {"type": "string", "description": "Movie ID"},
+                            "date": {"type": "string", "description": "Date in YYYY-MM-DD format"},
+                            "location": {"type": "string", "description": "City, state or ZIP code"}
+                        },
+                        "required": ["movie_id", "date", "location"]
+                    }
+                ),
+                Tool(
+                    name="get_seat_map",
+                    description="Displays available and reserved seats for a specific showtime",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "showtime_id": {"type": "string", "description": "Showtime ID"}
+                        },
+                        "required": ["showtime_id"]
+                    }
+                ),
+                Tool(
+                    name="book_seats",
+                    description="Reserves selected seats for the user",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "showtime_id": {"type": "string", "description": "Showtime ID"},
+                            "seats": {"type": "array", "items": {"type": "string"}, "description": "List of seat numbers (e.g., ['A5', 'A6'])"},
+                            "user_id": {"type": "string", "description": "User identifier"}
+                        },
+                        "required": ["showtime_id", "seats", "user_id"]
+                    }
+                ),
+                Tool(
+                    name="process_payment",
+                    description="Handles simulated payment transaction",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "booking_id": {"type": "string", "description": "Booking ID"},
+                            "payment_method": {"type": "string", "description": "Payment method (card, cash, etc.)"},
+                            "amount": {"type": "number", "description": "Payment amount"}
+                        },
+                        "required": ["booking_id", "payment_method", "amount"]
+                    }
+                )
+            ]
+        )
+        
         @self.server.list_tools()
         async def list_tools() -> ListToolsResult:
             """List available tools"""
-            return ListToolsResult(
-                tools=[
-                    Tool(
-                        name="get_now_showing",
-                        description="Returns a list of movies currently showing in a given city or ZIP code",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "location": {"type": "string", "description": "City, state or ZIP code"}
-                            },
-                            "required": ["location"]
-                        }
-                    ),
-                    Tool(
-                        name="get_recommendations",
-                        description="Suggests movies based on mood, genre, or time preferences",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "genre": {"type": "string", "description": "Movie genre (optional)"},
-                                "mood": {"type": "string", "description": "Mood description (optional)"},
-                                "time_preference": {"type": "string", "description": "Time of day preference (optional)"}
-                            }
-                        }
-                    ),
-                    Tool(
-                        name="get_showtimes",
-                        description="Fetches available showtimes for a specific movie and location",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "movie_id": {"type": "string", "description": "Movie ID"},
-                                "date": {"type": "string", "description": "Date in YYYY-MM-DD format"},
-                                "location": {"type": "string", "description": "City, state or ZIP code"}
-                            },
-                            "required": ["movie_id", "date", "location"]
-                        }
-                    ),
-                    Tool(
-                        name="get_seat_map",
-                        description="Displays available and reserved seats for a specific showtime",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "showtime_id": {"type": "string", "description": "Showtime ID"}
-                            },
-                            "required": ["showtime_id"]
-                        }
-                    ),
-                    Tool(
-                        name="book_seats",
-                        description="Reserves selected seats for the user",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "showtime_id": {"type": "string", "description": "Showtime ID"},
-                                "seats": {"type": "array", "items": {"type": "string"}, "description": "List of seat numbers (e.g., ['A5', 'A6'])"},
-                                "user_id": {"type": "string", "description": "User identifier"}
-                            },
-                            "required": ["showtime_id", "seats", "user_id"]
-                        }
-                    ),
-                    Tool(
-                        name="process_payment",
-                        description="Handles simulated payment transaction",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "booking_id": {"type": "string", "description": "Booking ID"},
-                                "payment_method": {"type": "string", "description": "Payment method (card, cash, etc.)"},
-                                "amount": {"type": "number", "description": "Payment amount"}
-                            },
-                            "required": ["booking_id", "payment_method", "amount"]
-                        }
-                    )
-                ]
-            )
+            return self._tools_result
         
         @self.server.call_tool()
         async def call_tool(request: CallToolRequest) -> CallToolResult:
             """Handle tool calls"""
             try:
-                if request.name == "get_now_showing":
-                    return await self._get_now_showing(request.arguments)
-                elif request.name == "get_recommendations":
-                    return await self._get_recommendations(request.arguments)
-                elif request.name == "get_showtimes":
-                    return await self._get_showtimes(request.arguments)
-                elif request.name == "get_seat_map":
-                    return await self._get_seat_map(request.arguments)
-                elif request.name == "book_seats":
-                    return await self._book_seats(request.arguments)
-                elif request.name == "process_payment":
-                    return await self._process_payment(request.arguments)
-                else:
+                handler = self._tool_dispatch.get(request.name)
+                if handler is None:
                     return CallToolResult(
                         content=[TextContent(type="text", text=f"Unknown tool: {request.name}")]
                     )
+                return await handler(request.arguments)
             except Exception as e:
                 logger.error(f"Error calling tool {request.name}: {e}")
                 return CallToolResult(
@@ -227,27 +424,11 @@ class AMCMCPServer:
         """Get movies currently showing in a location"""
         location = args.get("location", "")
         
-        # Filter movies by location (simplified - match any theater in the area)
-        showing_movies = []
-        for movie in self.movies.values():
-            # Simple mock logic - show all movies for any location
-            movie_data = {
-                "movie_id": movie.movie_id,
-                "title": movie.title,
-                "rating": movie.rating,
-                "duration": movie.duration,
-                "genre": movie.genre,
-                "description": movie.description
-            }
-            showing_movies.append(movie_data)
-        
-        result = {
-            "location": location,
-            "movies": showing_movies[:10]  # Limit to 10 movies
-        }
+        # Simple mock logic - show the same movies (up to 10) for any location
+        data = b'{"location":' + _ENCODER.encode(location) + b',"movies":' + self._catalog.now_showing_json + b"}"
         
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, indent=2))]
+            content=[_json_text(data)]
         )
     
     async def _get_recommendations(self, args: Dict[str, Any]) -> CallToolResult:
@@ -255,46 +436,8 @@ class AMCMCPServer:
         genre = args.get("genre", "").lower()
         mood = args.get("mood", "").lower()
         
-        recommendations = []
-        for movie in self.movies.values():
-            # Simple matching logic
-            if genre and genre in movie.genre.lower():
-                recommendations.append({
-                    "movie_id": movie.movie_id,
-                    "title": movie.title,
-                    "genre": movie.genre,
-                    "description": movie.description,
-                    "rating": movie.rating
-                })
-            elif mood and (mood in movie.description.lower() or mood in movie.genre.lower()):
-                recommendations.append({
-                    "movie_id": movie.movie_id,
-                    "title": movie.title,
-                    "genre": movie.genre,
-                    "description": movie.description,
-                    "rating": movie.rating
-                })
-        
-        if not recommendations and not genre and not mood:
-            # Return top picks if no specific criteria
-            recommendations = [
-                {
-                    "movie_id": movie.movie_id,
-                    "title": movie.title,
-                    "genre": movie.genre,
-                    "description": movie.description,
-                    "rating": movie.rating
-                }
-                for movie in list(self.movies.values())[:5]
-            ]
-        
-        result = {
-            "criteria": {"genre": genre, "mood": mood},
-            "recommendations": recommendations[:5]
-        }
-        
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, indent=2))]
+            content=[_json_text(self._catalog.cached_recommendations(genre, mood))]
         )
     
     async def _get_showtimes(self, args: Dict[str, Any]) -> CallToolResult:
@@ -302,84 +445,41 @@ class AMCMCPServer:
         movie_id = args.get("movie_id")
         date = args.get("date")
         location = args.get("location")
+        catalog = self._catalog
         
-        if not movie_id or movie_id not in self.movies:
+        if not movie_id or movie_id not in catalog.movies:
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": "Invalid movie ID"}))]
+                content=[_to_text({"error": "Invalid movie ID"})]
             )
         
-        movie = self.movies[movie_id]
-        showtimes = []
-        
-        for showtime in self.showtimes.values():
-            if showtime.movie_id == movie_id and showtime.date == date:
-                theater = self.theaters.get(showtime.theater_id)
-                if theater:
-                    showtimes.append({
-                        "showtime_id": showtime.showtime_id,
-                        "theater_name": theater.name,
-                        "theater_address": theater.address,
-                        "time": showtime.time,
-                        "format": showtime.format,
-                        "price": showtime.price
-                    })
+        movie = catalog.movies[movie_id]
         
         result = {
             "movie": {"id": movie.movie_id, "title": movie.title},
             "date": date,
             "location": location,
-            "showtimes": showtimes
+            "showtimes": catalog.showtimes_by_movie_date.get((movie_id, date), [])
         }
         
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, indent=2))]
+            content=[_to_text(result)]
         )
     
     async def _get_seat_map(self, args: Dict[str, Any]) -> CallToolResult:
         """Get seat map for a showtime"""
         showtime_id = args.get("showtime_id")
+        catalog = self._catalog
         
-        if not showtime_id or showtime_id not in self.showtimes:
+        if not showtime_id or showtime_id not in catalog.showtimes:
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": "Invalid showtime ID"}))]
+                content=[_to_text({"error": "Invalid showtime ID"})]
             )
         
-        # Get seats for this showtime (mock data)
-        seats = self.seats_data.get(showtime_id, [])
-        seat_map = []
-        
-        for seat_data in seats:
-            # Check if seat is already booked
-            is_booked = any(
-                seat_data["seat_number"] in booking.seats and booking.status == "confirmed"
-                for booking in self.bookings.values()
-                if booking.showtime_id == showtime_id
-            )
-            
-            seat_map.append({
-                "seat_number": seat_data["seat_number"],
-                "row": seat_data["row"],
-                "column": seat_data["column"],
-                "is_available": not is_booked,
-                "price_tier": seat_data["price_tier"],
-                "price": seat_data.get("price", 15.00)
-            })
-        
-        showtime = self.showtimes[showtime_id]
-        theater = self.theaters.get(showtime.theater_id)
-        movie = self.movies.get(showtime.movie_id)
-        
-        result = {
-            "showtime_id": showtime_id,
-            "movie": movie.title if movie else "Unknown",
-            "theater": theater.name if theater else "Unknown Theater",
-            "date": showtime.date,
-            "time": showtime.time,
-            "seat_map": seat_map
-        }
+        booked = self._booked_seats.get(showtime_id, _NO_SEATS)
+        data = render_seat_map(catalog.seat_map_templates[showtime_id], booked)
         
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, indent=2))]
+            content=[_json_text(data)]
         )
     
     async def _book_seats(self, args: Dict[str, Any]) -> CallToolResult:
@@ -387,50 +487,41 @@ class AMCMCPServer:
         showtime_id = args.get("showtime_id")
         seats = args.get("seats", [])
         user_id = args.get("user_id")
+        catalog = self._catalog
         
-        if not showtime_id or showtime_id not in self.showtimes:
+        if not showtime_id or showtime_id not in catalog.showtimes:
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": "Invalid showtime ID"}))]
+                content=[_to_text({"error": "Invalid showtime ID"})]
             )
         
         if not seats or not user_id:
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": "Seats and user_id are required"}))]
+                content=[_to_text({"error": "Seats and user_id are required"})]
             )
         
         # Check seat availability
         unavailable_seats = []
         total_price = 0.0
         
-        showtime_seats = self.seats_data.get(showtime_id, [])
-        seat_lookup = {s["seat_number"]: s for s in showtime_seats}
+        seat_prices = catalog.seat_prices.get(showtime_id, {})
+        booked = self._booked_seats.get(showtime_id, _NO_SEATS)
         
         for seat_num in seats:
-            # Check if seat exists
-            if seat_num not in seat_lookup:
+            seat_price = seat_prices.get(seat_num)
+            if seat_price is None:
                 unavailable_seats.append(f"{seat_num} (doesn't exist)")
-                continue
-            
-            # Check if already booked
-            is_booked = any(
-                seat_num in booking.seats and booking.status == "confirmed"
-                for booking in self.bookings.values()
-                if booking.showtime_id == showtime_id
-            )
-            
-            if is_booked:
+            elif seat_num in booked:
                 unavailable_seats.append(f"{seat_num} (already booked)")
             else:
-                seat_price = seat_lookup[seat_num].get("price", 15.00)
                 total_price += seat_price
         
         if unavailable_seats:
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": f"Unavailable seats: {', '.join(unavailable_seats)}"}))]
+                content=[_to_text({"error": f"Unavailable seats: {', '.join(unavailable_seats)}"})]
             )
         
         # Create booking
-        booking_id = str(uuid.uuid4())
+        booking_id = self._ids.booking_id()
         booking = Booking(
             booking_id=booking_id,
             showtime_id=showtime_id,
@@ -438,14 +529,14 @@ class AMCMCPServer:
             user_id=user_id,
             status="pending",
             total_price=total_price,
-            created_at=datetime.now().isoformat()
+            created_at=now_iso()
         )
         
         self.bookings[booking_id] = booking
         
-        showtime = self.showtimes[showtime_id]
-        theater = self.theaters.get(showtime.theater_id)
-        movie = self.movies.get(showtime.movie_id)
+        showtime = catalog.showtimes[showtime_id]
+        theater = catalog.theaters.get(showtime.theater_id)
+        movie = catalog.movies.get(showtime.movie_id)
         
         result = {
             "booking_id": booking_id,
@@ -459,7 +550,7 @@ class AMCMCPServer:
         }
         
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, indent=2))]
+            content=[_to_text(result)]
         )
     
     async def _process_payment(self, args: Dict[str, Any]) -> CallToolResult:
@@ -470,23 +561,23 @@ class AMCMCPServer:
         
         if not booking_id or booking_id not in self.bookings:
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": "Invalid booking ID"}))]
+                content=[_to_text({"error": "Invalid booking ID"})]
             )
         
         booking = self.bookings[booking_id]
         
         if booking.status != "pending":
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": f"Booking status is {booking.status}, expected pending"}))]
+                content=[_to_text({"error": f"Booking status is {booking.status}, expected pending"})]
             )
         
         if abs(amount - booking.total_price) > 0.01:  # Allow for small rounding differences
             return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps({"error": f"Amount mismatch. Expected ${booking.total_price:.2f}, got ${amount:.2f}"}))]
+                content=[_to_text({"error": f"Amount mismatch. Expected ${booking.total_price:.2f}, got ${amount:.2f}"})]
             )
         
         # Simulate payment processing (always succeeds in mock)
-        payment_id = str(uuid.uuid4())
+        payment_id = self._ids.payment_id()
         receipt_url = f"https://amc.com/receipts/{payment_id}"
         
         payment = Payment(
@@ -502,10 +593,12 @@ class AMCMCPServer:
         
         # Update booking status
         booking.status = "confirmed"
+        self._booked_seats[booking.showtime_id].update(booking.seats)
         
-        showtime = self.showtimes[booking.showtime_id]
-        theater = self.theaters.get(showtime.theater_id)
-        movie = self.movies.get(showtime.movie_id)
+        catalog = self._catalog
+        showtime = catalog.showtimes[booking.showtime_id]
+        theater = catalog.theaters.get(showtime.theater_id)
+        movie = catalog.movies.get(showtime.movie_id)
         
         result = {
             "payment_id": payment_id,
@@ -523,7 +616,7 @@ class AMCMCPServer:
         }
         
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(result, indent=2))]
+            content=[_to_text(result)]
         )
     
     async def run(self):
@@ -536,10 +629,15 @@ class AMCMCPServer:
             )
 
 
+async def _serve():
+    """Load the mock data and serve over stdio"""
+    server = await AMCMCPServer.create()
+    await server.run()
+
+
 def main():
     """Main entry point"""
-    server = AMCMCPServer()
-    asyncio.run(server.run())
+    asyncio.run(_serve())
 
 
 if __name__ == "__main__":
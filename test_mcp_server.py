@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for AMC MCP Server (low-level MCP version)
+Checks the precomputed indexes, seat map templates and recommendation cache
+against the straightforward computations they replace
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from amc_mcp.server import AMCMCPServer, Movie, Showtime
+
+
+def _call(handler, args) -> dict:
+    """Run a tool handler and decode its JSON response"""
+    result = asyncio.run(handler(args))
+    return json.loads(result.content[0].text)
+
+
+def _expected_seat_map(server: AMCMCPServer, showtime_id: str) -> dict:
+    """Seat map built directly from the seat data and confirmed bookings"""
+    showtime = server.showtimes[showtime_id]
+    theater = server.theaters.get(showtime.theater_id)
+    movie = server.movies.get(showtime.movie_id)
+    booked = {
+        seat
+        for booking in server.bookings.values()
+        if booking.showtime_id == showtime_id and booking.status == "confirmed"
+        for seat in booking.seats
+    }
+    return {
+        "showtime_id": showtime_id,
+        "movie": movie.title if movie else "Unknown",
+        "theater": theater.name if theater else "Unknown Theater",
+        "date": showtime.date,
+        "time": showtime.time,
+        "seat_map": [
+            {
+                "seat_number": seat["seat_number"],
+                "row": seat["row"],
+                "column": seat["column"],
+                "is_available": seat["seat_number"] not in booked,
+                "price_tier": seat["price_tier"],
+                "price": seat.get("price", 15.00)
+            }
+            for seat in server.seats_data.get(showtime_id, [])
+        ]
+    }
+
+
+def test_recommendations_in_catalog_order():
+    """Responses list the first five matching movies in catalog order"""
+    print("🧪 Testing recommendation responses (MCP server)...")
+    server = asyncio.run(AMCMCPServer.create())
+
+    # Single, combined, mixed case, no criteria and no match; matching itself
+    # is fuzzed against MovieSearch in test_movie_search.py
+    queries = [
+        {"genre": "action"},
+        {"mood": "revenge"},
+        {"genre": "ACTION", "mood": "family"},
+        {"genre": "sci", "mood": "the"},
+        {},
+        {"genre": "xyz"},
+    ]
+    movies = list(server.movies.values())
+    for args in queries:
+        genre = args.get("genre", "").lower()
+        mood = args.get("mood", "").lower()
+        expected = [
+            movie.movie_id for movie in movies
+            if (genre and genre in movie.genre.lower())
+            or (mood and (mood in movie.description.lower() or mood in movie.genre.lower()))
+        ]
+        if not genre and not mood:
+            expected = [movie.movie_id for movie in movies]
+
+        data = _call(server._get_recommendations, args)
+        assert data["criteria"] == {"genre": genre, "mood": mood}
+        assert [r["movie_id"] for r in data["recommendations"]] == expected[:5], args
+
+    print(f"   ✅ {len(queries)} queries returned the expected movies")
+
+
+def test_recommendation_cache_follows_reload():
+    """Reloading the catalog drops recommendations cached for the old one"""
+    print("🧪 Testing recommendation cache (MCP server)...")
+    server = asyncio.run(AMCMCPServer.create())
+
+    assert _call(server._get_recommendations, {"genre": "documentary"})["recommendations"] == []
+
+    movies = dict(server.movies)
+    movies["mv999"] = Movie(
+        movie_id="mv999",
+        title="Test Documentary",
+        rating="PG",
+        duration=90,
+        genre="Documentary",
+        description="A test entry",
+        poster_url=""
+    )
+    asyncio.run(server._install_catalog(movies, server.theaters, server.showtimes, server.seats_data))
+
+    data = _call(server._get_recommendations, {"genre": "documentary"})
+    assert [r["movie_id"] for r in data["recommendations"]] == ["mv999"]
+    print("   ✅ Reloaded catalog served the new movie")
+
+
+async def _requests_during_reload(server: AMCMCPServer, tables: tuple) -> int:
+    """Send requests until a reload of tables finishes, checking every response"""
+    expected = [
+        (server._get_seat_map, {"showtime_id": "st001"}),
+        (server._get_showtimes, {"movie_id": "mv001", "date": "2025-10-28", "location": "Boston, MA"}),
+        (server._get_recommendations, {"genre": "action", "mood": "revenge"}),
+    ]
+    expected = [(handler, args, (await handler(args)).content[0].text) for handler, args in expected]
+
+    reload = asyncio.create_task(server._install_catalog(*tables))
+    checked = 0
+    while not reload.done():
+        for handler, args, text in expected:
+            assert (await handler(args)).content[0].text == text, args
+        checked += 1
+        await asyncio.sleep(0)
+    await reload
+    return checked
+
+
+def test_requests_during_reload():
+    """Requests served while a reload is indexing see a complete catalog"""
+    print("🧪 Testing requests during a reload (MCP server)...")
+    server = asyncio.run(AMCMCPServer.create())
+
+    # Enough extra showtimes, on a date no request asks for, to keep the
+    # index build busy across many requests; they come first so the real
+    # showtimes are indexed last
+    showtimes = {}
+    seats_data = {}
+    template = server.showtimes["st001"]
+    for i in range(20000):
+        showtime_id = f"st_load_{i}"
+        showtimes[showtime_id] = Showtime(
+            showtime_id=showtime_id,
+            movie_id=template.movie_id,
+            theater_id=template.theater_id,
+            date="2030-01-01",
+            time=template.time,
+            format=template.format,
+            price=template.price
+        )
+        seats_data[showtime_id] = server.seats_data["st001"]
+    showtimes.update(server.showtimes)
+    seats_data.update(server.seats_data)
+
+    checked = asyncio.run(_requests_during_reload(server, (server.movies, server.theaters, showtimes, seats_data)))
+    assert checked > 0
+    assert "st_load_0" in server.showtimes
+    print(f"   ✅ {checked} request rounds served during the reload")
+
+
+def test_seat_maps_match_bookings():
+    """Spliced seat map templates match seat maps built from the bookings"""
+    print("🧪 Testing seat map templates (MCP server)...")
+    server = asyncio.run(AMCMCPServer.create())
+
+    for showtime_id in server.showtimes:
+        assert _call(server._get_seat_map, {"showtime_id": showtime_id}) == _expected_seat_map(server, showtime_id)
+
+    # A pending booking leaves seats available until it is paid for
+    booking = _call(server._book_seats, {"showtime_id": "st001", "seats": ["A5", "A6"], "user_id": "test_user"})
+    assert _call(server._get_seat_map, {"showtime_id": "st001"}) == _expected_seat_map(server, "st001")
+    assert all(s["is_available"] for s in _call(server._get_seat_map, {"showtime_id": "st001"})["seat_map"])
+
+    _call(server._process_payment, {
+        "booking_id": booking["booking_id"],
+        "payment_method": "card",
+        "amount": booking["total_price"]
+    })
+    seat_map = _call(server._get_seat_map, {"showtime_id": "st001"})
+    assert seat_map == _expected_seat_map(server, "st001")
+    assert {s["seat_number"] for s in seat_map["seat_map"] if not s["is_available"]} == {"A5", "A6"}
+    print("   ✅ Seat maps matched for every showtime")
+
+
+if __name__ == "__main__":
+    test_recommendations_in_catalog_order()
+    test_recommendation_cache_follows_reload()
+    test_requests_during_reload()
+    test_seat_maps_match_bookings()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test that the generated mock data module matches data/*.json
+The FastMCP server loads amc_mcp._mock_data while the MCP server reads the JSON
+files, so a stale module would make the two serve different catalogs
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from amc_mcp import _mock_data
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def test_mock_data_module_matches_json():
+    """Every table in the generated module equals its source JSON file"""
+    print("🧪 Checking generated mock data against data/*.json...")
+
+    for name, filename in [
+        ("MOVIES", "movies.json"),
+        ("THEATERS", "theaters.json"),
+        ("SHOWTIMES", "showtimes.json"),
+        ("SEATS", "seats.json"),
+    ]:
+        with open(DATA_DIR / filename, "r") as f:
+            expected = json.load(f)
+        assert getattr(_mock_data, name) == expected, (
+            f"src/amc_mcp/_mock_data.py is out of date with data/{filename}; "
+            "run python scripts/gen_mock_data.py"
+        )
+        print(f"   ✅ {name} matches data/{filename}")
+
+
+if __name__ == "__main__":
+    test_mock_data_module_matches_json()
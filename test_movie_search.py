@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Fuzz test for the shared recommendation index
+Checks MovieSearch genre/mood lookups against a brute-force substring scan
+"""
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from amc_mcp._common import MovieSearch
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def _random_query(rng: random.Random, vocabulary: list) -> str:
+    """A catalog word, phrase or fragment"""
+    query = rng.choice(vocabulary)
+    roll = rng.random()
+    if roll < 0.3:
+        query = f"{query}{rng.choice([' ', '/', '-', ', '])}{rng.choice(vocabulary)}"
+    if roll < 0.6 and len(query) > 3:
+        start = rng.randrange(len(query) - 2)
+        query = query[start:start + rng.randint(1, 6)]
+    return query.lower()
+
+
+def test_movie_search_matches_substring_scan():
+    """Index lookups return exactly what scanning every movie would"""
+    print("🧪 Fuzzing MovieSearch...")
+
+    with open(DATA_DIR / "movies.json", "r") as f:
+        movies = json.load(f)
+    vocabulary = sorted({
+        word
+        for movie in movies
+        for word in f"{movie['genre']} {movie['genre'].replace('/', ' ')} {movie['description']}".split()
+    }) + ["a", "e", "ion", "sci-fi", "feel good", "x y", "?!", "zzz"]
+
+    # The real catalog plus shuffled entries, so words overlap across many movies
+    rng = random.Random(1234)
+    entries = [(movie["genre"].lower(), movie["description"].lower()) for movie in movies]
+    for _ in range(200):
+        genre = "/".join(rng.sample([m["genre"] for m in movies], 2))
+        description = " ".join(rng.choices(vocabulary, k=12))
+        entries.append((genre.lower(), description.lower()))
+    search = MovieSearch(entries)
+
+    for _ in range(3000):
+        query = _random_query(rng, vocabulary)
+        assert search.genre_matches(query) == {
+            i for i, (genre, _) in enumerate(entries) if query in genre
+        }, query
+        assert search.mood_matches(query) == {
+            i for i, (genre, description) in enumerate(entries)
+            if query in description or query in genre
+        }, query
+
+    print("   ✅ 3000 queries matched the substring scan")
+
+
+if __name__ == "__main__":
+    test_movie_search_matches_substring_scan()
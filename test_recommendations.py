@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test recommendation responses (FastMCP version)
+Matching itself is fuzzed against MovieSearch in test_movie_search.py; these
+checks cover which entries reach the response and in what order
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Import the module
+import amc_mcp.fastmcp_server as server_module
+
+# (genre, mood) criteria: single, combined, mixed case, no criteria, no match
+QUERIES = [
+    ("action", None),
+    (None, "revenge"),
+    ("ACTION", "family"),
+    ("sci", "the"),
+    (None, None),
+    ("xyz", None),
+]
+
+
+def test_recommendations_in_catalog_order():
+    """Responses list the first five matching movies in catalog order"""
+    print("🧪 Testing recommendation responses (FastMCP)...")
+
+    movies = list(server_module.movies.values())
+    for genre, mood in QUERIES:
+        genre_lower = genre.lower() if genre else ""
+        mood_lower = mood.lower() if mood else ""
+        expected = [
+            movie.movie_id for movie in movies
+            if (genre_lower and genre_lower in movie.genre.lower())
+            or (mood_lower and (mood_lower in movie.description.lower() or mood_lower in movie.genre.lower()))
+        ]
+        if not genre and not mood:
+            expected = [movie.movie_id for movie in movies]
+
+        result = json.loads(server_module._get_recommendations(genre, mood, "evening"))
+        assert result["criteria"] == {"genre": genre, "mood": mood, "time_preference": "evening"}
+        assert [r["movie_id"] for r in result["recommendations"]] == expected[:5], (genre, mood)
+
+    print(f"   ✅ {len(QUERIES)} queries returned the expected movies")
+
+
+def test_reload_clears_recommendation_cache():
+    """Reloading the catalog drops recommendations cached for the old one"""
+    print("🧪 Testing recommendation cache reload (FastMCP)...")
+
+    server_module._get_recommendations(genre="action")
+    assert server_module._get_recommendations.cache_info().currsize > 0
+
+    server_module.load_mock_data()
+    assert server_module._get_recommendations.cache_info().currsize == 0
+    print("   ✅ Cache cleared on reload")
+
+
+if __name__ == "__main__":
+    test_recommendations_in_catalog_order()
+    test_reload_clears_recommendation_cache()